@@ -1,6 +1,7 @@
 from typing import Optional
 
 import numpy as np
+from joblib import Parallel, delayed
 
 from team.data_preprocessing import DataPreprocessing
 from team.trajectory import Trajectory
@@ -46,22 +47,27 @@ class AlignedTrajectories:
         return Trajectory(self.aligned_trajectories[i, :, :])
 
     @staticmethod
-    def _load_data(data_path: str) -> list[Trajectory]:
+    def _load_data(data_path: str, n_jobs: Optional[int] = None) -> list[Trajectory]:
         """
         Loads the dataset as a list of dataframes
 
         :param data_path: the path to reach the dataset folder
+        :param n_jobs: number of jobs used to load the files in parallel, see
+        `joblib.Parallel`. Default to a single job.
         :return: the list of dataframes corresponding to the demonstration dataset
         """
         files_paths = get_demo_files(data_path)
-        trajectories = []
-        for file_path in files_paths:
-            trajectories.append(Trajectory.from_file(file_path))
-        return trajectories
+        # the files are parsed independently, in the order of [files_paths]
+        return Parallel(n_jobs=n_jobs)(
+            delayed(Trajectory.from_file)(file_path) for file_path in files_paths
+        )
 
     @classmethod
     def load_dataset_and_preprocess(
-        cls, data_path: str, window: Optional[float] = None
+        cls,
+        data_path: str,
+        window: Optional[float] = None,
+        n_jobs: Optional[int] = None,
     ) -> "AlignedTrajectories":
         """
         Loads data from dataset, preprocesses it and returns the aligned trajectories
@@ -69,9 +75,11 @@ class AlignedTrajectories:
         :param data_path: path to the dataset
         :param window: only allow for maximal shifts from the two diagonals smaller
         than this number in seconds. Default to maximum.
+        :param n_jobs: number of jobs used to load and align the trajectories in
+        parallel, see `joblib.Parallel`. Default to a single job.
         :return: aligned trajectories
         """
-        trajectories_list = AlignedTrajectories._load_data(data_path)
-        dp = DataPreprocessing(trajectories_list, sampling_rate=100)
+        trajectories_list = AlignedTrajectories._load_data(data_path, n_jobs)
+        dp = DataPreprocessing(trajectories_list, sampling_rate=100, n_jobs=n_jobs)
         dp.preprocessing(window)
         return cls.from_list_trajectories(dp.aligned_and_padded_trajectories)
@@ -3,6 +3,7 @@ from typing import Optional
 import numpy as np
 import pandas as pd
 from dtaidistance import dtw, dtw_ndim
+from joblib import Parallel, delayed
 
 from team.trajectory import Trajectory
 
@@ -20,14 +21,22 @@ class DataPreprocessing:
 
     :param traj_to_align: trajectories to align
     :param sampling_rate: the desired sampling frequency
+    :param n_jobs: number of jobs used to align the trajectories in parallel, see
+        `joblib.Parallel`. Default to a single job.
     """
 
-    def __init__(self, traj_to_align: list[Trajectory], sampling_rate: int) -> None:
+    def __init__(
+        self,
+        traj_to_align: list[Trajectory],
+        sampling_rate: int,
+        n_jobs: Optional[int] = None,
+    ) -> None:
         self.trajectories_to_align = traj_to_align
         # minimal cumulative distance demonstration as reference
         self.reference_index = self.select_reference_index()
         self.reference = self.trajectories_to_align[self.reference_index]
         self._sampling_rate = sampling_rate
+        self._n_jobs = n_jobs
         # final output of the algorithm
         self.aligned_and_padded_trajectories = [self.reference]
 
@@ -40,12 +49,15 @@ class DataPreprocessing:
         :param traj: the trajectory to extend
         """
 
-        # No copy of the numpy array is done when converting to a DataFrame, and thus,
-        # we are still working on the trajectory.
-        df = pd.DataFrame(traj.trajectory)
-        for i, is_duplicated in enumerate(df.duplicated()):
-            if is_duplicated:
-                df.iloc[i:, 0] = df.iloc[i:, 0] + traj.period
+        is_duplicated = pd.DataFrame(traj.trajectory).duplicated().to_numpy()
+        nb_duplicates = np.cumsum(is_duplicated)
+        # Each duplicated row pushes itself and all the following rows by one period.
+        # Since the last timestamp moves too, the period grows by a factor
+        # n / (n - 1) after every shift.
+        growth = len(traj) / (len(traj) - 1)
+        shifts = traj.period * growth ** np.arange(nb_duplicates[-1])
+        offsets = np.concatenate(([0.0], np.cumsum(shifts)))
+        traj.trajectory[:, 0] += offsets[nb_duplicates]
 
     @staticmethod
     def _pad_to_same_length(trajectories: list[Trajectory]) -> None:
@@ -74,7 +86,7 @@ class DataPreprocessing:
         ds = dtw.distance_matrix_fast(time_series)
         # sum over one axis (ds matrix is symmetric)
         cumulative_dist = np.sum(ds, axis=1)
-        return np.argwhere(cumulative_dist == np.min(cumulative_dist))[0][0]
+        return int(np.argmin(cumulative_dist))
 
     def _align_data(self, window: Optional[float] = None) -> None:
         """
@@ -86,7 +98,8 @@ class DataPreprocessing:
         """
         # end effector position information considered
         tcp_ref = self.reference.tcp
-        path = None
+        trajectories = []
+        windows = []
         for i, trajectory in enumerate(self.trajectories_to_align):
             if i == self.reference_index:
                 continue
@@ -95,10 +108,18 @@ class DataPreprocessing:
                 # Convert windows in second to measurements.
                 window = int(window / max(trajectory.period, self.reference.period))
 
-            path = dtw_ndim.warping_path(
-                from_s=trajectory.tcp, to_s=tcp_ref, window=window, psi=2
+            trajectories.append(trajectory)
+            windows.append(window)
+
+        # the warping paths are independent from each other
+        paths = Parallel(n_jobs=self._n_jobs)(
+            delayed(dtw_ndim.warping_path)(
+                from_s=trajectory.tcp, to_s=tcp_ref, window=traj_window, psi=2
             )
+            for trajectory, traj_window in zip(trajectories, windows)
+        )
 
+        for trajectory, path in zip(trajectories, paths):
             aligned_path = [p[0] for p in path]
             # found transformation applied to original dataframe
             aligned_trajectory = Trajectory(trajectory.trajectory[aligned_path])
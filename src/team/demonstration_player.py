@@ -5,6 +5,9 @@ from rws2.RWS_wrapper import RwsWrapper
 
 from team.trajectory import Trajectory
 
+# external axis values of a RAPID jointtarget, formatted once
+_EXT_AXIS = str([9e9, 9e9, 9e9, 9e9, 9e9, 9e9])
+
 
 class DemonstrationPlayer:
     """
@@ -25,15 +28,6 @@ class DemonstrationPlayer:
         self.tol_diff = tolerance_diff
         self.rws = RwsWrapper(robot_url=base_url)
 
-    def is_target_eligible(self) -> bool:
-        """
-        Checks that the distance between the actual robot joint angles and the target
-        joint angles is large enough. It avoids performing micro movements.
-
-        :return: boolean assessing if the target needs to be considered or not
-        """
-        return self.compute_difference() > self.tol_diff
-
     def compute_difference(self) -> float:
         """
         Computes the norm between the two joint angles vectors.
@@ -53,15 +47,13 @@ class DemonstrationPlayer:
 
         :param trajectory: Trajectories object to reproduce
         """
+        # the eligible targets only depend on the trajectory, select them beforehand
+        targets = trajectory.joints[trajectory.waypoint_indices(self.tol_diff)]
         self.rws.set_RAPID_variable("program_running", "TRUE")
-        for i, joints in enumerate(trajectory.joints):
+        for joints in targets:
             self.next_target = joints
-            if i == 0:
-                self.current_pose = joints
-                self.execute_target(self.set_target())
-            elif self.is_target_eligible():
-                self.execute_target(self.set_target())
-                self.current_pose = self.next_target
+            self.execute_target(self.set_target())
+            self.current_pose = self.next_target
         self.rws.robot.motors_off()
 
     def set_target(self) -> str:
@@ -72,10 +64,8 @@ class DemonstrationPlayer:
         the external axis
         """
         assert self.next_target is not None
-        joint_list = self.next_target.tolist()
-        ext_axis_list = [9e9, 9e9, 9e9, 9e9, 9e9, 9e9]
-        target = str([joint_list, ext_axis_list])
-        return target
+        joints = ", ".join(map(repr, self.next_target.tolist()))
+        return f"[[{joints}], {_EXT_AXIS}]"
 
     def execute_target(self, target) -> None:
         """
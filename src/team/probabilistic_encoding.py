@@ -1,6 +1,7 @@
 from typing import Optional
 
 import numpy as np
+from joblib import Parallel, delayed
 from scipy import stats
 from sklearn.mixture import GaussianMixture
 from sklearn.model_selection import train_test_split
@@ -32,6 +33,7 @@ class ProbabilisticEncoding:
         max_nb_components: int = 10,
         random_state: Optional[int] = None,
         shuffle: bool = True,
+        n_jobs: Optional[int] = None,
     ) -> None:
         """
         :param trajectories: dataset with robot joint angle trajectories
@@ -43,8 +45,11 @@ class ProbabilisticEncoding:
         :param random_state: reproducibility of GMM initialization for testing purposes
         :param shuffle: shuffle the train and test set while determining the best GMM
             Set to False to have reproducible runs.
+        :param n_jobs: number of jobs used to run the JS metric search and the BIC
+            criterion in parallel, see `joblib.Parallel`. Default to a single job.
         """
         self._iterations = iterations
+        self._n_jobs = n_jobs
         _, self.length_demo, self._nb_features = np.shape(
             trajectories.aligned_trajectories
         )
@@ -123,24 +128,25 @@ class ProbabilisticEncoding:
         n_components_range = range(min_nb_components, max_nb_components)
         # clear js_metric_results
         self.js_metric_results = {}
-        # loop over range
-        for n in n_components_range:
-            component = JSComponent(n)
-            # loop over number runs
-            for _ in range(self._iterations):
-                train, test = train_test_split(
-                    self.trajectories,
-                    test_size=0.5,
-                    random_state=random_state,
-                    shuffle=shuffle,
-                )
-                # fit over the train and test datasets
-                gmm_train = GaussianMixture(n, random_state=random_state).fit(train)
-                gmm_test = GaussianMixture(n, random_state=random_state).fit(test)
-                # compute the JS distance between the two datasets
-                component.append(self._js_metric(gmm_train, gmm_test))
-
-            self.js_metric_results[n] = component
+        # the train and test sets of a run do not depend on the number of components
+        splits = [
+            train_test_split(
+                self.trajectories,
+                test_size=0.5,
+                random_state=random_state,
+                shuffle=shuffle,
+            )
+            for _ in range(self._iterations)
+        ]
+        # all the runs are independent, loop over range and over number runs
+        js_distances = Parallel(n_jobs=self._n_jobs)(
+            delayed(self._js_run)(train, test, n, random_state)
+            for n in n_components_range
+            for train, test in splits
+        )
+        for i, n in enumerate(n_components_range):
+            runs = js_distances[i * self._iterations : (i + 1) * self._iterations]
+            self.js_metric_results[n] = JSComponent(n, runs)
 
         # identify statistically significant best GMM nb_components
         self.nb_comp_js = self._statistically_significant_component()
@@ -148,16 +154,42 @@ class ProbabilisticEncoding:
             nb_components=self.nb_comp_js, random_state=random_state
         )
 
+    @staticmethod
+    def _js_run(
+        train: np.ndarray,
+        test: np.ndarray,
+        nb_components: int,
+        random_state: Optional[int] = None,
+    ) -> float:
+        """
+        Fits a GMM on each of the train and test sets and computes the JS metric between
+        the two GMMs.
+
+        :param train: train set of shape (n_samples, n_features)
+        :param test: test set of shape (n_samples, n_features)
+        :param nb_components: number of GMM components
+        :param random_state: reproducibility of GMM initialization for testing purposes.
+        :return: the JS metric between the train and test GMMs
+        """
+        # fit over the train and test datasets
+        gmm_train = GaussianMixture(nb_components, random_state=random_state).fit(train)
+        gmm_test = GaussianMixture(nb_components, random_state=random_state).fit(test)
+        # compute the JS distance between the two datasets
+        return ProbabilisticEncoding._js_metric(gmm_train, gmm_test)
+
     def compute_scores_bic_criterion(
         self,
         max_nb_components: int,
         min_nb_components: int,
+        n_jobs: Optional[int] = None,
     ) -> dict[str, list]:
         """
         Computes the BIC criterion for the range of GMM components.
 
         :param min_nb_components: min components number to define range of search space
         :param max_nb_components: max components number to define range of search space
+        :param n_jobs: number of jobs used to fit the GMMs in parallel, see
+            `joblib.Parallel`. Default to the n_jobs given at construction.
         :return: the BIC scores
         """
         # check valid range for number components
@@ -171,22 +203,22 @@ class ProbabilisticEncoding:
                 "be larger or equal to min_nb_components and "
                 "min_nb_components not smaller than 2"
             )
+        if n_jobs is None:
+            n_jobs = self._n_jobs
         # search space range
         n_components_range = range(min_nb_components, max_nb_components)
         # clear bic_scores
         bic_scores = {}
-        # loop over range
+        # all the fits are independent, loop over range and over number runs
+        scores = Parallel(n_jobs=n_jobs)(
+            delayed(self._bic_run)(self.trajectories, n)
+            for n in n_components_range
+            for _ in range(self._iterations)
+        )
         mean_components = []
         std_components = []
-        for n in n_components_range:
-            scores_component = []
-            # loop over number runs
-            for _ in range(self._iterations):
-                # fit GMM
-                gmm_fit = GaussianMixture(n).fit(self.trajectories)
-                # compute the JS distance between the two datasets
-                scores_component.append(gmm_fit.bic(self.trajectories))
-
+        for i in range(len(n_components_range)):
+            scores_component = scores[i * self._iterations : (i + 1) * self._iterations]
             mean_components.append(np.mean(scores_component))
             std_components.append(np.std(scores_component))
         bic_scores["means"] = mean_components
@@ -194,6 +226,18 @@ class ProbabilisticEncoding:
 
         return bic_scores
 
+    @staticmethod
+    def _bic_run(data: np.ndarray, nb_components: int) -> float:
+        """
+        Fits a GMM on the data and computes its BIC score.
+
+        :param data: dataset of shape (n_samples, n_features)
+        :param nb_components: number of GMM components
+        :return: the BIC score of the fitted GMM on the data
+        """
+        gmm_fit = GaussianMixture(nb_components).fit(data)
+        return gmm_fit.bic(data)
+
     def _statistically_significant_component(self) -> int:
         """
         Compares the JS metric samples [self.js_metric_results] to statistically infer
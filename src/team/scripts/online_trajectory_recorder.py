@@ -1,11 +1,11 @@
 import argparse
 import os.path
+from time import sleep
 from timeit import default_timer as timer
 
 from rws2.RWS2 import RWS
 
 from team.recorders.demonstration_recorder import DemonstrationRecorder
-from team.utility.handling_data import create_default_dict
 
 # Create object for parsing command-line options
 parser = argparse.ArgumentParser(
@@ -44,10 +44,12 @@ def main():
         record = DemonstrationRecorder(data_path=args.dest_path)
 
         rws_robot = RWS(args.url)
-        data = create_default_dict()
-        # wait for the RAPID program to start
+        # wait for the RAPID program to start, backing off between polls so the
+        # controller is not flooded with requests (unit: seconds)
+        poll_interval = 0.01
         while not rws_robot.is_running():
-            pass
+            sleep(poll_interval)
+            poll_interval = min(2 * poll_interval, 0.2)
         # since RWS2 doesn't return a timestamp with the measurement
         # compute it from Python
         t_start = timer()
@@ -59,7 +61,7 @@ def main():
             values_list = timestamp + tcp_pos + tcp_ori + rob_cf + joints
             # check that all information are available
             if tcp_pos and tcp_ori and rob_cf and joints:
-                info = {key: value for (key, value) in zip(data.keys(), values_list)}
+                info = {key: value for (key, value) in zip(record.data, values_list)}
                 record.update(tmp_dict=info)
         # save data to file
         record.create_file()
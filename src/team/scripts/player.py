@@ -30,8 +30,9 @@ if os.path.splitext(args.demo_path)[1] != ".json":
     exit()
 
 try:
-    play = DemonstrationPlayer(base_url=args.url)
+    # load the demonstration before connecting so that a bad file fails fast
     trajectory = Trajectory.from_file(args.demo_path)
+    play = DemonstrationPlayer(base_url=args.url)
     play.play(trajectory)
 finally:
     pass
@@ -1,11 +1,8 @@
 import argparse
-from timeit import default_timer as timer
 
 import keyboard
-from rws2.RWS_wrapper import RwsWrapper
 
-from team.recorders.demonstration_recorder import DemonstrationRecorder
-from team.utility.handling_data import create_default_dict
+from team.recorders.lead_demonstration_recorder import LeadDemonstrationRecorder
 
 # Create object for parsing command-line options
 parser = argparse.ArgumentParser(
@@ -32,29 +29,16 @@ if not args.url or not args.dest_path:
     exit()
 
 try:
-    record = DemonstrationRecorder(data_path=args.dest_path)
-
-    rws = RwsWrapper(args.url)
-    data = create_default_dict()
+    # puts the robot in lead-through mode and starts the recording clock
+    record = LeadDemonstrationRecorder(robot_url=args.url, data_path=args.dest_path)
     var = "ready_flag"
-    # setup robot mode
-    rws.activate_lead_through()
-    # since RWS2 doesn't return a timestamp with the measurement, compute it from Python
-    t_start = timer()
     while True:
-        tcp_pos, tcp_ori, rob_cf = rws.robot.get_tcp_info()
-        joints = rws.robot.get_joints_positions()
-        timestamp = [timer() - t_start]
-        values_list = timestamp + tcp_pos + tcp_ori + rob_cf + joints
-        # check that all information are available
-        if tcp_pos and tcp_ori and rob_cf and joints:
-            info = {key: value for (key, value) in zip(data.keys(), values_list)}
-            record.update(tmp_dict=info)
+        record.record()
         if keyboard.is_pressed("q"):
             break
     # robot shutdown operations
-    rws.deactivate_lead_through()
-    rws.set_RAPID_variable(var, "FALSE")
+    record.rws.deactivate_lead_through()
+    record.rws.set_RAPID_variable(var, "FALSE")
     # save data to file
     record.create_file()
 
@@ -2,7 +2,6 @@ import json
 import os
 
 import numpy as np
-from scipy import interpolate
 
 from team.trajectory_base import TrajectoryBase
 
@@ -33,11 +32,10 @@ class TimedTrajectory(TrajectoryBase):
         )
         with open(trajectory_path, "r") as f:
             trajectory_dict = json.load(f)
-            d = np.transpose(np.array(list(trajectory_dict.values())))
-            timestamp = d[:, 0].reshape(-1, 1)
-            joints = d[:, -6:]
-            joints_info = np.hstack((timestamp, joints))
-            return cls(joints_info)
+        columns = list(trajectory_dict.values())
+        # only the timestamp and the joints (last 6) are converted
+        joints_info = np.column_stack([columns[0], *columns[-6:]])
+        return cls(joints_info)
 
     @property
     def timestamps(self) -> np.ndarray:
@@ -61,9 +59,9 @@ class TimedTrajectory(TrajectoryBase):
 
     def upsample(self, des_freq: int) -> None:
         """
-        Upsample the trajectory by computing a linear interpolation function fitting
-        the joints to the timestamp and then generates the missing values applying
-        the interpolating function to the time vector sampled at des_freq.
+        Upsample the trajectory by linearly interpolating the joints between the two
+        recorded timestamps surrounding each point of the time vector sampled at
+        des_freq. The timestamps must be sorted in increasing order.
 
         :param des_freq: the desired sampling frequency
         """
@@ -71,16 +69,24 @@ class TimedTrajectory(TrajectoryBase):
         # Starts the timestamps at 0
         self._trajectory[:, 0] = self.timestamps - self.timestamps[0]
 
-        f_interpolate = interpolate.interp1d(
-            self.timestamps, self._trajectory[:, 1:], axis=0
-        )
         num = (
             round((self.timestamps[-1] - 0) / (1 / des_freq)) + 1
         )  # i.e. length of resulting array
         time_new = np.linspace(0, self.timestamps[-1], num)
-        # use interpolation function returned by `interp1d` to generate new data points
-        joints_new = f_interpolate(time_new)
-        self._trajectory = np.append(time_new.reshape(-1, 1), joints_new, axis=1)
+        # indices of the recorded points surrounding each new timestamp
+        hi = np.clip(np.searchsorted(self.timestamps, time_new), 1, len(self) - 1)
+        lo = hi - 1
+        # interpolate all the columns at once
+        t_lo = self.timestamps[lo]
+        dt = self.timestamps[hi] - t_lo
+        values_lo = self._trajectory[lo, 1:]
+        slope = (self._trajectory[hi, 1:] - values_lo) / dt[:, None]
+        # write the time and the interpolated values directly in the new trajectory
+        upsampled = np.empty((num, self._trajectory.shape[1]))
+        upsampled[:, 0] = time_new
+        slope *= (time_new - t_lo)[:, None]
+        np.add(slope, values_lo, out=upsampled[:, 1:])
+        self._trajectory = upsampled
 
     def pad_end_to(self, final_len: int) -> None:
         """Pads the end of the trajectory by duplicating the last element until [self]
@@ -96,6 +102,6 @@ class TimedTrajectory(TrajectoryBase):
 
             super().pad_end_to(final_len)
 
-            self.trajectory[current_len : len(self), 0] += np.linspace(
-                0.01, nb_samples * 0.01, nb_samples
+            self.trajectory[current_len : len(self), 0] += 0.01 * np.arange(
+                1, nb_samples + 1
             )
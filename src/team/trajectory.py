@@ -30,12 +30,11 @@ class Trajectory(TimedTrajectory):
         )
         with open(trajectory_path, "r") as f:
             trajectory_dict = json.load(f)
-            d = np.transpose(np.array(list(trajectory_dict.values())))
-            timestamp = d[:, 0].reshape(-1, 1)
-            joints = d[:, -6:]
-            tcp_position = d[:, 1:4]
-            joints_info = np.hstack((timestamp, joints, tcp_position))
-            return cls(joints_info)
+        columns = list(trajectory_dict.values())
+        # only the timestamp, the joints (last 6) and the tcp position (1 to 3) are
+        # converted, directly in their final order
+        joints_info = np.column_stack([columns[0], *columns[-6:], *columns[1:4]])
+        return cls(joints_info)
 
     @property
     def tcp(self) -> np.ndarray:
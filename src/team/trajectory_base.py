@@ -3,10 +3,12 @@ from abc import ABC, abstractmethod
 from pathlib import Path
 
 import numpy as np
-import pandas as pd
 
 import team.utility.accuracy_metric as team_metric
 
+# number of samples compared at once when searching for the next waypoint
+_WAYPOINT_BLOCK = 64
+
 
 class TrajectoryBase(ABC):
     """
@@ -53,12 +55,36 @@ class TrajectoryBase(ABC):
         :return: the rms error along the trajectory
         """
 
-        error = 0
-        for i in range(len(self.joints)):
-            error += np.linalg.norm(
-                self.get_joints_at_index(i) - other_trajectory.get_joints_at_index(i)
-            )
-        return error / np.sqrt(len(self.joints))
+        joints = self.joints
+        # distances between the joint vectors at each index of the trajectory
+        distances = np.linalg.norm(
+            joints - other_trajectory.joints[: len(joints)], axis=1
+        )
+        return distances.sum() / np.sqrt(len(joints))
+
+    def waypoint_indices(self, tol_diff: float = 1) -> np.ndarray:
+        """
+        Selects the joint targets to execute: the first one, then every target whose
+        distance to the previously selected target is larger than [tol_diff].
+        The distances are computed on blocks of samples rather than one by one.
+
+        :param tol_diff: threshold on the error norm between consecutive targets
+        :return: indices of the selected targets, in increasing order
+        """
+        joints = self.joints
+        tol_diff_sq = tol_diff**2
+        indices = [0]
+        start = 1
+        while start < len(joints):
+            difference = joints[start : start + _WAYPOINT_BLOCK] - joints[indices[-1]]
+            distances_sq = np.einsum("ij,ij->i", difference, difference)
+            (far,) = np.nonzero(distances_sq > tol_diff_sq)
+            if len(far):
+                indices.append(start + int(far[0]))
+                start = indices[-1] + 1
+            else:
+                start += _WAYPOINT_BLOCK
+        return np.array(indices)
 
     def joints_to_string(self, tol_diff: int = 1) -> str:
         """
@@ -70,14 +96,10 @@ class TrajectoryBase(ABC):
         :return: string containing the sequence of joint targets separated by a new line
         """
 
-        current_pose = self.get_joints_at_index(0)
-        selected_waypoint = [self._joint_to_string(self.get_joints_at_index(0))]
-        for joints in self.joints:
-            if self._target_is_eligible(joints, current_pose, tol_diff):
-                selected_waypoint.append(self._joint_to_string(joints))
-                current_pose = joints
-        selected_waypoint.append(self._joint_to_string(self.get_joints_at_index(-1)))
-        return "\n".join(selected_waypoint)
+        # the selected targets followed by the last one, rounded all at once
+        indices = np.append(self.waypoint_indices(tol_diff), -1)
+        selected_joints = np.around(self.joints[indices], decimals=3).tolist()
+        return "\n".join(str(joints) for joints in selected_joints)
 
     def flip_trajectory(self) -> None:
         """
@@ -86,32 +108,6 @@ class TrajectoryBase(ABC):
 
         self._trajectory = np.flip(self._trajectory, axis=0)
 
-    @staticmethod
-    def _joint_to_string(joints: np.ndarray) -> str:
-        """
-        Converts the joints vector into a string
-
-        :param joints: joint angles vector to cast
-        :return: string containing the joints vector
-        """
-        return str(np.around(joints, decimals=3).tolist())
-
-    @staticmethod
-    def _target_is_eligible(
-        next_target: np.ndarray, current_pose: np.ndarray, tol_diff: float
-    ) -> bool:
-        """
-        Checks that the distance between the actual robot joint angles and the target
-        joint angles is large enough. It avoids performing micro movements.
-
-        :param next_target: vector of the next target joint angles
-        :param current_pose: vector of current joint angles
-        :param tol_diff: tolerance on the error norm between consecutive targets
-        :return: boolean assessing if the target needs to be considered or not
-        """
-        distance = np.linalg.norm(next_target - current_pose)
-        return distance > tol_diff
-
     def symmetric_gmcc(self, other: "TrajectoryBase") -> float:
         return team_metric.symmetric_gmcc(self.joints, other.joints)
 
@@ -128,14 +124,13 @@ class TrajectoryBase(ABC):
         :param final_len: the final length of the padded trajectory
         """
         if len(self) != final_len:
-            # computes number of missing data points
-            nb_samples = final_len - len(self)
-            # duplicates nb_samples time the last row
-            df = pd.DataFrame(self._trajectory)
-            df = pd.concat([df, pd.concat([df.iloc[-1:]] * nb_samples)])
-            # updates the timestamps
-            df.reset_index(drop=True, inplace=True)
-            self._trajectory = df.to_numpy()
+            padded = np.empty(
+                (final_len, self._trajectory.shape[1]), dtype=self._trajectory.dtype
+            )
+            padded[: len(self)] = self._trajectory
+            # duplicates the last row in all the missing data points
+            padded[len(self) :] = self._trajectory[-1]
+            self._trajectory = padded
 
     @classmethod
     def from_config_file(
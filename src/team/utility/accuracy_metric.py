@@ -4,20 +4,16 @@ from pathlib import Path
 import numpy as np
 from rws2.RWS2 import RWS
 
-from team.utility.lie_algebra_and_tf import quaternion_matrix, se3_inverse
+from team.utility.lie_algebra_and_tf import quaternion_rotation_distance
 from team.utility.optimizer import Optimizer
 
 
-def endpoint_accuracy(rws: RWS) -> float:
+def _read_poses(rws: RWS) -> tuple[list[float], list[float]]:
     """
-    Computes the homogeneous rotation matrix from the quaternions list and then add
-    the translation vector to obtain a homogeneous transformation matrix
-    appertaining in the Lie group SE(3).
-    It does that to the target and robot endpoint pose transformations.
-    Finally, it calculates the relative transformation and assesses the discrepancy.
+    Reads the endpoint and target poses from RAPID.
 
     :param rws: RWS object to interface with the robot controller
-    :return: the error between the relative transformation and the identity
+    :return: the endpoint pose and the target pose as [x, y, z, q1, q2, q3, q4]
     """
 
     # reads the endpoint pose computed through forward kinematics in RAPID
@@ -28,26 +24,30 @@ def endpoint_accuracy(rws: RWS) -> float:
     target_pose_lists = rws.get_robtarget_variables("target_pose")
     target_pose = target_pose_lists[0] + target_pose_lists[1]
 
-    # get quaternions vectors as [qw, qx, qy, qz]
-    target_ori = [target_pose[6]] + target_pose[3:6]
-    endpoint_ori = [endpoint_pose[6]] + endpoint_pose[3:6]
+    return endpoint_pose, target_pose
 
-    # get translation vectors in m instead of mm
-    target_tran = [t / 1000 for t in target_pose[:3]]
-    endpoint_tran = [c / 1000 for c in endpoint_pose[:3]]
 
-    # SE3 matrices construction
-    t_start = quaternion_matrix(endpoint_ori)
-    t_start[:3, 3] = endpoint_tran
-    t_goal = quaternion_matrix(target_ori)
-    t_goal[:3, 3] = target_tran
+def endpoint_accuracy(rws: RWS) -> float:
+    """
+    Assesses the discrepancy between the identity and the relative transformation,
+    in the Lie group SE(3), from the robot endpoint pose to the target pose.
+    It is computed from the rotation and translation blocks of the relative
+    transformation, without building the homogeneous transformation matrices.
+
+    :param rws: RWS object to interface with the robot controller
+    :return: the error between the relative transformation and the identity
+    """
 
-    # relative transformation between target and current pose
-    relative_t = np.dot(se3_inverse(t_start), t_goal)
+    endpoint_pose, target_pose = _read_poses(rws)
 
-    error = np.linalg.norm(relative_t - np.eye(4))
+    # the squared distance of the relative transformation to the identity splits into
+    # the rotation block ||R_s^T R_g - I||^2 and the translation block
+    # ||R_s^T (t_g - t_s)||^2, the latter being ||t_g - t_s||^2 as R_s^T is a rotation
+    ori_error = _orientation_error(endpoint_pose, target_pose)
+    # translation in m instead of mm
+    pos_error = _position_error(endpoint_pose, target_pose) / 1000
 
-    return error
+    return np.sqrt(ori_error**2 + pos_error**2)
 
 
 def endpoint_position_accuracy(rws: RWS) -> float:
@@ -61,30 +61,21 @@ def endpoint_position_accuracy(rws: RWS) -> float:
     :return: the position error between the relative transformation and the identity
     """
 
-    # reads the endpoint pose computed through forward kinematics in RAPID
-    endpoint_pose_lists = rws.get_robtarget_variables("endpoint_pose")
-    endpoint_pose = endpoint_pose_lists[0] + endpoint_pose_lists[1]
+    return _position_error(*_read_poses(rws))
 
-    # reads the target pose in RAPID
-    target_pose_lists = rws.get_robtarget_variables("target_pose")
-    target_pose = target_pose_lists[0] + target_pose_lists[1]
 
-    # get translation vectors in m instead of mm
-    target_tran = [t for t in target_pose[:3]]
-    endpoint_tran = [c for c in endpoint_pose[:3]]
-
-    # SE3 matrices construction
-    t_start = np.eye(4)
-    t_start[:3, 3] = endpoint_tran
-    t_goal = np.eye(4)
-    t_goal[:3, 3] = target_tran
-
-    # relative transformation between target and current pose
-    relative_t = np.dot(se3_inverse(t_start), t_goal)
+def _position_error(endpoint_pose: list[float], target_pose: list[float]) -> float:
+    """
+    Computes the position error between two poses already read from RAPID.
 
-    error = np.linalg.norm(relative_t - np.eye(4))
+    :param endpoint_pose: robot endpoint pose as [x, y, z, q1, q2, q3, q4]
+    :param target_pose: target pose as [x, y, z, q1, q2, q3, q4]
+    :return: the position error between the relative transformation and the identity
+    """
 
-    return error
+    # the relative transformation between two pure translations is the translation
+    # between them, thus its distance to the identity is the distance between them
+    return np.linalg.norm(np.subtract(target_pose[:3], endpoint_pose[:3]))
 
 
 def endpoint_orientation_accuracy(rws: RWS) -> float:
@@ -98,28 +89,24 @@ def endpoint_orientation_accuracy(rws: RWS) -> float:
     :return: the orientation error between the relative transformation and the identity
     """
 
-    # reads the endpoint pose computed through forward kinematics in RAPID
-    endpoint_pose_lists = rws.get_robtarget_variables("endpoint_pose")
-    endpoint_pose = endpoint_pose_lists[0] + endpoint_pose_lists[1]
+    return _orientation_error(*_read_poses(rws))
 
-    # reads the target pose in RAPID
-    target_pose_lists = rws.get_robtarget_variables("target_pose")
-    target_pose = target_pose_lists[0] + target_pose_lists[1]
+
+def _orientation_error(endpoint_pose: list[float], target_pose: list[float]) -> float:
+    """
+    Computes the orientation error between two poses already read from RAPID.
+
+    :param endpoint_pose: robot endpoint pose as [x, y, z, q1, q2, q3, q4]
+    :param target_pose: target pose as [x, y, z, q1, q2, q3, q4]
+    :return: the orientation error between the relative transformation and the identity
+    """
 
     # get quaternions vectors as [qw, qx, qy, qz]
     target_ori = [target_pose[6]] + target_pose[3:6]
     endpoint_ori = [endpoint_pose[6]] + endpoint_pose[3:6]
 
-    # SE3 matrices construction
-    t_start = quaternion_matrix(endpoint_ori)
-    t_goal = quaternion_matrix(target_ori)
-
-    # relative transformation between target and current pose
-    relative_t = np.dot(se3_inverse(t_start), t_goal)
-
-    error = np.linalg.norm(relative_t - np.eye(4))
-
-    return error
+    # distance between the relative rotation and the identity
+    return quaternion_rotation_distance(endpoint_ori, target_ori)
 
 
 def endpoint_joint_accuracy(rws: RWS, goal_j: np.ndarray) -> float:
@@ -208,9 +195,11 @@ def save_model_performance(
     model_perf_path = dir_path.joinpath("model_performance.json")
     if model_perf_path.exists() and not exist_ok:
         raise FileExistsError("Not allowed to override an existing file!")
+    # read the poses once and share them between the position and orientation errors
+    endpoint_pose, target_pose = _read_poses(rws)
     data = {
-        "pos_error": endpoint_position_accuracy(rws),
-        "ori_error": endpoint_orientation_accuracy(rws),
+        "pos_error": _position_error(endpoint_pose, target_pose),
+        "ori_error": _orientation_error(endpoint_pose, target_pose),
         "j_error": endpoint_joint_accuracy(rws, goal_joints),
     }
     with open(model_perf_path, "w") as f:
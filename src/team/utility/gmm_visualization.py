@@ -2,7 +2,8 @@ from typing import Optional
 
 import matplotlib.pyplot as plt
 import numpy as np
-from matplotlib.patches import Ellipse
+from matplotlib.collections import EllipseCollection
+from matplotlib.colors import to_rgba
 
 from team.probabilistic_encoding import ProbabilisticEncoding
 
@@ -20,12 +21,17 @@ def plot_gmm(
     :param prediction: regression line prediction
     """
     x = gmm.trajectories
+    w_factor = 0.2 / gmm.gmm.weights_.max()
     for i in range(1, np.shape(x)[1]):
+        # means and covariances of all the Gaussians in the (time, joint i) plane
+        means = gmm.gmm.means_[:, [0, i]]
+        covariances = gmm.gmm.covariances_[:, [0, i]][:, :, [0, i]]
+
         plt.figure(figsize=(10, 8))
         plt.scatter(x[:, 0], x[:, i], s=1, cmap="viridis", zorder=1, label="datapoints")
         plt.scatter(
-            gmm.gmm.means_[:, 0],
-            gmm.gmm.means_[:, i],
+            means[:, 0],
+            means[:, 1],
             c="black",
             s=200,
             alpha=0.5,
@@ -36,13 +42,7 @@ def plot_gmm(
         plt.ylabel("joint angle [deg]", fontsize=16)
         plt.title(f"Joint {i} evolution", fontsize=20)
 
-        w_factor = 0.2 / gmm.gmm.weights_.max()
-        for pos, covar, w in zip(
-            gmm.gmm.means_, gmm.gmm.covariances_, gmm.gmm.weights_
-        ):
-            covar = covar[0 : i + 1 : i, 0 : i + 1 : i]
-            pos = pos[0 : i + 1 : i]
-            draw_ellipse(pos, covar, alpha=w * w_factor)
+        draw_ellipses(means, covariances, gmm.gmm.weights_ * w_factor)
         if x_query is not None and prediction is not None:
             plt.plot(
                 x_query,
@@ -152,26 +152,48 @@ def plot_bic_scores(bic_scores: dict[str, list]) -> None:
     plt.show()
 
 
-def draw_ellipse(position, covariance, ax=None, **kwargs) -> None:
+def draw_ellipses(
+    positions: np.ndarray, covariances: np.ndarray, alphas: np.ndarray, ax=None
+) -> None:
     """
-    Draw an ellipse with a given position and covariance
+    Draw the ellipses of several Gaussians at once, as a single collection
 
-    :param position: position of the ellipse center
-    :param covariance: covariance of the ellipse
-    :param ax: axes object to add ellipse to
+    :param positions: positions of the ellipses centers, of shape (K, 2)
+    :param covariances: full covariances of the ellipses, of shape (K, 2, 2)
+    :param alphas: transparency of the ellipses of each Gaussian, of shape (K,)
+    :param ax: axes object to add ellipses to
     """
     ax = ax or plt.gca()
-    # Convert covariance to principal axes
-    if covariance.shape == (2, 2):
-        u, s, _ = np.linalg.svd(covariance)
-        angle = np.degrees(np.arctan2(u[1, 0], u[0, 0]))
-        width, height = 2 * np.sqrt(s)
-    else:
-        angle = 0
-        width, height = 2 * np.sqrt(covariance)
-
-    # Draw the Ellipse
-    for std_dev in range(1, 4):
-        ax.add_patch(
-            Ellipse(position, std_dev * width, std_dev * height, angle, **kwargs)
+    # Convert all the covariances to principal axes
+    u, s, _ = np.linalg.svd(covariances)
+    angles = np.degrees(np.arctan2(u[:, 1, 0], u[:, 0, 0]))
+    widths, heights = 2 * np.sqrt(s).T
+    colors = np.tile(to_rgba(plt.rcParams["patch.facecolor"]), (len(alphas), 1))
+    colors[:, 3] = alphas
+
+    # Draw the 1, 2 and 3 std ellipses, Gaussian after Gaussian
+    std_devs = np.arange(1, 4)
+    ax.add_collection(
+        EllipseCollection(
+            np.outer(widths, std_devs).ravel(),
+            np.outer(heights, std_devs).ravel(),
+            np.repeat(angles, len(std_devs)),
+            units="xy",
+            offsets=np.repeat(positions, len(std_devs), axis=0),
+            offset_transform=ax.transData,
+            facecolors=np.repeat(colors, len(std_devs), axis=0),
+            edgecolors="none",
+        )
+    )
+    # the collection only accounts for the centers, include the largest ellipses
+    semi_width, semi_height = std_devs[-1] * widths / 2, std_devs[-1] * heights / 2
+    cos, sin = np.cos(np.radians(angles)), np.sin(np.radians(angles))
+    half_extents = np.column_stack(
+        (
+            np.hypot(semi_width * cos, semi_height * sin),
+            np.hypot(semi_width * sin, semi_height * cos),
         )
+    )
+    ax.update_datalim(
+        np.concatenate((positions - half_extents, positions + half_extents))
+    )
@@ -26,6 +26,29 @@ def quaternion_matrix(quaternion: list):
     )
 
 
+def quaternion_rotation_distance(quaternion_a: list, quaternion_b: list) -> float:
+    """
+    Return the Frobenius norm of the difference between the rotation from
+    quaternion_a to quaternion_b and the identity, without building the rotation
+    matrices.
+
+    For rotation matrices, ||Ra^T Rb - I|| = sqrt(8) sin(theta / 2), theta being the
+    angle of the relative rotation, and sin(theta / 2) is given by the wedge product of
+    the two normalized quaternions.
+    """
+    quaternions = []
+    for quaternion in (quaternion_a, quaternion_b):
+        q = np.array(quaternion[:4], dtype=np.float64, copy=True)
+        nq = np.dot(q, q)
+        # quaternion_matrix returns the identity rotation for null quaternions
+        if nq < _EPS:
+            q, nq = np.array([0.0, 0.0, 0.0, 1.0]), 1.0
+        quaternions.append(q / math.sqrt(nq))
+    outer = np.outer(quaternions[0], quaternions[1])
+    sin_half_angle_sq = 0.5 * np.sum((outer - outer.T) ** 2)
+    return math.sqrt(8.0 * sin_half_angle_sq)
+
+
 def se3_inverse(p: np.ndarray) -> np.ndarray:
     """
     :param p: absolute SE(3) pose
@@ -1,8 +1,10 @@
 import platform
 import unittest
 from pathlib import Path
+from unittest import mock
 
 import numpy as np
+from joblib import Parallel
 
 from team.aligned_trajectories import AlignedTrajectories
 from team.gaussian_mixture_regression import GMR
@@ -145,6 +147,32 @@ class ProbabilisticEncodingTest(unittest.TestCase):
         )
         self.assertTrue(pe3.nb_comp_js in [4, 5, 6])
 
+    def test_bic_criterion_n_jobs(self):
+        """Tests that the n_jobs given at construction reaches the BIC sweep."""
+        rng = np.random.default_rng(0)
+        samples = np.concatenate(
+            [rng.normal(center, 1, size=(20, 10)) for center in (0, 20, 40)]
+        )
+        samples[:, 0] = np.arange(len(samples))
+        trajectories = AlignedTrajectories.from_list_trajectories([Trajectory(samples)])
+        pe = ProbabilisticEncoding(
+            trajectories,
+            max_nb_components=4,
+            min_nb_components=2,
+            iterations=2,
+            random_state=0,
+            n_jobs=2,
+        )
+        with mock.patch(
+            "team.probabilistic_encoding.Parallel", wraps=Parallel
+        ) as mock_parallel:
+            scores = pe.compute_scores_bic_criterion(4, 2)
+            self.assertEqual(mock_parallel.call_args.kwargs["n_jobs"], 2)
+            # an explicit value overrides the one given at construction
+            pe.compute_scores_bic_criterion(4, 2, n_jobs=1)
+            self.assertEqual(mock_parallel.call_args.kwargs["n_jobs"], 1)
+        self.assertEqual(len(scores["means"]), 2)
+
     def test_gmr_implementation(self):
         if self.is_arm():
             return
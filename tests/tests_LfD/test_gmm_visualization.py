@@ -0,0 +1,63 @@
+import unittest
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+from matplotlib.collections import EllipseCollection  # noqa: E402
+
+from team.utility.gmm_visualization import draw_ellipses  # noqa: E402
+
+
+class GmmVisualizationTest(unittest.TestCase):
+    @staticmethod
+    def _rotated_covariance(angle: float, variances: list[float]) -> np.ndarray:
+        rotation = np.array(
+            [[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]]
+        )
+        return rotation @ np.diag(variances) @ rotation.T
+
+    def test_draw_ellipses(self) -> None:
+        positions = np.array([[0.0, 0.0], [10.0, 5.0]])
+        covariances = np.array(
+            [np.diag([4.0, 1.0]), self._rotated_covariance(np.radians(30), [9, 1])]
+        )
+        fig, ax = plt.subplots()
+        draw_ellipses(positions, covariances, np.array([0.1, 0.2]), ax=ax)
+
+        (ellipses,) = [c for c in ax.collections if isinstance(c, EllipseCollection)]
+        # the 1, 2 and 3 std ellipses of each Gaussian
+        np.testing.assert_array_almost_equal(
+            ellipses.get_offsets(), np.repeat(positions, 3, axis=0)
+        )
+        np.testing.assert_array_almost_equal(
+            ellipses.get_facecolors()[:, 3], [0.1, 0.1, 0.1, 0.2, 0.2, 0.2]
+        )
+        plt.close(fig)
+
+    def test_draw_ellipses_data_limits(self) -> None:
+        # the data limits are the bounding box of the 3 std ellipse, whose half
+        # extents depend on both the principal axes lengths and the orientation
+        angle = np.radians(30)
+        cases = [
+            (np.diag([4.0, 1.0]), [6, 3]),
+            (np.diag([1.0, 4.0]), [3, 6]),
+            (
+                self._rotated_covariance(angle, [9, 1]),
+                [
+                    np.hypot(9 * np.cos(angle), 3 * np.sin(angle)),
+                    np.hypot(9 * np.sin(angle), 3 * np.cos(angle)),
+                ],
+            ),
+        ]
+        position = np.array([10.0, 5.0])
+        for covariance, half_extents in cases:
+            fig, ax = plt.subplots()
+            draw_ellipses(position[None], covariance[None], np.array([0.5]), ax=ax)
+            np.testing.assert_array_almost_equal(
+                ax.dataLim.get_points(),
+                [position - half_extents, position + half_extents],
+            )
+            plt.close(fig)
@@ -0,0 +1,61 @@
+import unittest
+
+import numpy as np
+
+from team.utility.lie_algebra_and_tf import (
+    quaternion_matrix,
+    quaternion_rotation_distance,
+)
+
+
+class LieAlgebraTest(unittest.TestCase):
+    @staticmethod
+    def _matrix_distance(quaternion_a: list, quaternion_b: list) -> float:
+        # Frobenius distance between the relative rotation matrix and the identity
+        rotation_a = quaternion_matrix(quaternion_a)[:3, :3]
+        rotation_b = quaternion_matrix(quaternion_b)[:3, :3]
+        return np.linalg.norm(rotation_a.T @ rotation_b - np.eye(3))
+
+    def test_rotation_distance_random_quaternions(self) -> None:
+        rng = np.random.default_rng(0)
+        for _ in range(200):
+            quaternion_a = rng.normal(size=4).tolist()
+            quaternion_b = rng.normal(size=4).tolist()
+            self.assertAlmostEqual(
+                quaternion_rotation_distance(quaternion_a, quaternion_b),
+                self._matrix_distance(quaternion_a, quaternion_b),
+                places=12,
+            )
+
+    def test_rotation_distance_opposite_quaternions(self) -> None:
+        # q and -q represent the same rotation
+        quaternion = [0.1, -0.4, 0.3, 0.85]
+        opposite = [-q for q in quaternion]
+        self.assertAlmostEqual(
+            quaternion_rotation_distance(quaternion, opposite), 0, places=12
+        )
+        other = [0.5, 0.5, -0.5, 0.5]
+        self.assertAlmostEqual(
+            quaternion_rotation_distance(opposite, other),
+            self._matrix_distance(quaternion, other),
+            places=12,
+        )
+
+    def test_rotation_distance_identical_quaternions(self) -> None:
+        quaternion = [0.2, 0.1, -0.7, 0.6]
+        self.assertEqual(quaternion_rotation_distance(quaternion, quaternion), 0)
+
+    def test_rotation_distance_null_quaternion(self) -> None:
+        # a null quaternion is treated as the identity rotation
+        null = [0.0, 0.0, 0.0, 0.0]
+        quaternion = [0.0, 0.0, np.sin(np.pi / 4), np.cos(np.pi / 4)]
+        self.assertEqual(quaternion_rotation_distance(null, null), 0)
+        self.assertAlmostEqual(
+            quaternion_rotation_distance(null, quaternion),
+            self._matrix_distance(null, quaternion),
+            places=12,
+        )
+        # rotation of 90 degrees: sqrt(8) sin(45 degrees)
+        self.assertAlmostEqual(
+            quaternion_rotation_distance(quaternion, null), 2, places=12
+        )
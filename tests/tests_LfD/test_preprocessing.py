@@ -1,4 +1,5 @@
 import pathlib
+import tempfile
 import unittest
 
 import numpy as np
@@ -6,6 +7,8 @@ import pandas as pd
 
 from team.aligned_trajectories import AlignedTrajectories
 from team.data_preprocessing import DataPreprocessing
+from team.trajectory import Trajectory
+from team.utility.handling_data import create_default_dict, save_json_dict
 
 
 class PreprocessTest(unittest.TestCase):
@@ -52,3 +55,70 @@ class PreprocessTest(unittest.TestCase):
             )
             # test padding
             self.assertEqual(len(first_traj.trajectory), len(trajectory))
+
+
+class PreprocessingStepsTest(unittest.TestCase):
+    @staticmethod
+    def _trajectory(timestamps: list[float], values: list[float]) -> Trajectory:
+        trajectory = np.repeat(np.array(values, dtype=float).reshape(-1, 1), 10, axis=1)
+        trajectory[:, 0] = timestamps
+        return Trajectory(trajectory)
+
+    def test_extend_duplicates(self) -> None:
+        # a run of two repeated rows in the middle and a run of three at the end
+        traj = self._trajectory([0, 1, 1, 2, 2, 2], [0, 1, 1, 2, 2, 2])
+        DataPreprocessing._extend_duplicates(traj)
+        # each duplicate shifts itself and the following rows by the current period
+        np.testing.assert_array_almost_equal(
+            traj.timestamps, [0, 1, 1.4, 2.4, 2.88, 3.456]
+        )
+        np.testing.assert_array_equal(traj.joints[:, 0], [0, 1, 1, 2, 2, 2])
+
+    def test_extend_no_duplicates(self) -> None:
+        traj = self._trajectory([0, 0.5, 1, 1.5], [0, 1, 2, 3])
+        DataPreprocessing._extend_duplicates(traj)
+        np.testing.assert_array_equal(traj.timestamps, [0, 0.5, 1, 1.5])
+
+    @staticmethod
+    def _demonstrations() -> list[Trajectory]:
+        # the same motion demonstrated at different speeds
+        demonstrations = []
+        for length in (40, 55, 70):
+            phase = np.linspace(0, 1, length)
+            trajectory = np.zeros((length, 10))
+            trajectory[:, 0] = np.arange(length) * 0.01
+            trajectory[:, 1:7] = np.outer(np.sin(np.pi * phase), np.arange(1, 7))
+            trajectory[:, 7:] = np.column_stack((phase, phase**2, np.cos(phase)))
+            demonstrations.append(Trajectory(trajectory))
+        return demonstrations
+
+    def test_align_data_parallel(self) -> None:
+        aligned = []
+        for n_jobs in (1, 2):
+            dp = DataPreprocessing(
+                self._demonstrations(), sampling_rate=100, n_jobs=n_jobs
+            )
+            dp._align_data(window=0.2)
+            aligned.append(dp.aligned_and_padded_trajectories)
+        self.assertEqual(len(aligned[0]), 3)
+        for sequential, parallel in zip(*aligned):
+            np.testing.assert_array_equal(sequential.trajectory, parallel.trajectory)
+
+    def test_load_data_parallel(self) -> None:
+        rng = np.random.default_rng(0)
+        with tempfile.TemporaryDirectory() as data_path:
+            for i, length in enumerate((30, 45, 20, 60)):
+                demonstration = create_default_dict()
+                for key in demonstration:
+                    demonstration[key] = rng.normal(size=length).tolist()
+                file_path = pathlib.Path(data_path, f"demo_{i}", "trajectory.json")
+                save_json_dict(file_path, demonstration)
+            loaded = [
+                AlignedTrajectories._load_data(data_path, n_jobs=n_jobs)
+                for n_jobs in (1, 2)
+            ]
+        self.assertEqual(len(loaded[0]), 4)
+        # the files are returned in the same sorted order with both settings
+        for sequential, parallel in zip(*loaded):
+            np.testing.assert_array_equal(sequential.trajectory, parallel.trajectory)
+        self.assertEqual([len(traj.trajectory) for traj in loaded[0]], [30, 45, 20, 60])
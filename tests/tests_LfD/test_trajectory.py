@@ -119,6 +119,25 @@ class TrajectoriesTest(unittest.TestCase):
             traj.get_joint(0), np.array([1, 1.5, 2, 2.5, 3])
         )
 
+    def test_upsample_irregular_timestamps(self) -> None:
+        # irregular timestamps not starting at 0, values linear on each interval
+        joints = np.array([0.0, 10.0, 30.0])
+        traj = Trajectory(
+            np.column_stack(
+                (np.array([1.0, 1.5, 2.5]), *[k * joints for k in range(1, 10)])
+            )
+        )
+        traj.upsample(4)
+        np.testing.assert_array_almost_equal(
+            traj.timestamps, np.array([0, 0.25, 0.5, 0.75, 1, 1.25, 1.5])
+        )
+        expected = np.array([0, 5, 10, 15, 20, 25, 30])
+        # both interval ends are recorded points, the others are interpolated
+        for k in range(1, 10):
+            np.testing.assert_array_almost_equal(
+                traj.joint_and_tcp[:, k - 1], k * expected
+            )
+
     def test_load_list_of_trajectories(self) -> None:
         # standard data file to perform tests
         list_traj = [
@@ -182,6 +201,20 @@ class TrajectoriesTest(unittest.TestCase):
         )
         self.trajectory.flip_trajectory()
 
+    def test_waypoint_indices(self):
+        # test that targets are selected relatively to the last selected target
+        joints = np.zeros((100, 10))
+        joints[:, 0] = np.arange(100) * 0.01
+        joints[:, 1] = np.arange(100) * 0.3
+        trajectory = Trajectory(joints)
+        np.testing.assert_array_equal(
+            trajectory.waypoint_indices(tol_diff=1), np.arange(0, 100, 4)
+        )
+        np.testing.assert_array_equal(
+            trajectory.waypoint_indices(tol_diff=0), np.arange(100)
+        )
+        np.testing.assert_array_equal(trajectory.waypoint_indices(tol_diff=50), [0])
+
     def test_rms_error(self):
         # test that the correct computation of rms
         first_traj = Trajectory(